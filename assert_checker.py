@@ -1,5 +1,3 @@
-import pdb
-
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
@@ -19,15 +17,11 @@ class AssertChecker(BaseChecker):
     }
 
     def visit_compare(self, node: astroid.Compare):
-        found_assert = False
-        p = node.parent
-        while p is not None:
-            if isinstance(p, astroid.Assert):
-                found_assert = True
-                break
-            p = p.parent
-
-        if not found_assert:
+        # An assert can only contain expressions, so a comparison is inside an assert
+        # exactly when its enclosing statement is the assert. This stops at the nearest
+        # statement instead of walking all the way up to the module for every
+        # comparison that isn't in an assert.
+        if not isinstance(node.statement(), astroid.Assert):
             return
 
         if node.ops[0][0] in ["<=", ">=", "=="]:
@@ -1,5 +1,3 @@
-import pdb
-
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
@@ -15,7 +15,6 @@ from pyanimate.shape import CYAN, GREEN, MAGENTA, RED, YELLOW, Color
 from pyanimate.shape import Point as P
 
 style = sty.Style(padding=20, font="./examples/Roboto-Regular.ttf", font_size=32)
-sty.set_style(style)
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +128,7 @@ def main() -> None:
 
     ctx = RenderContext(args.width, args.height, (300, 300), args.scale)
 
+    sty.set_style(style)
     s = create_scene(ctx)
     try:
         s.play(args.frame_rate, args.output)
@@ -4,7 +4,9 @@ import logging
 import math
 import os
 from argparse import ArgumentParser
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum, IntEnum
+from functools import cache
 
 from kiwisolver import UnsatisfiableConstraint
 
@@ -33,7 +35,8 @@ class Endianness(str, Enum):
         return self.value
 
 
-def parse_args():
+@cache
+def _parser() -> ArgumentParser:
     parser = ArgumentParser(description="TODO: Description")
     parser.add_argument(
         "-r",
@@ -43,11 +46,12 @@ def parse_args():
     )
     parser.add_argument("-s", "--scale", default=2, type=float, help="TODO")
     parser.add_argument(
-        "-m", "--mode", choices=list(Mode), default=Mode.WIDTH, help="TODO"
+        "-m", "--mode", type=Mode, choices=list(Mode), default=Mode.WIDTH, help="TODO"
     )
     parser.add_argument(
         "-e",
         "--endianness",
+        type=Endianness,
         choices=list(Endianness),
         default=Endianness.LITTLE,
         help="TODO",
@@ -60,13 +64,22 @@ def parse_args():
     parser.add_argument("-p", "--padding", default=5, type=int, help="TODO")
     parser.add_argument("-f", "--font-size", default=32, type=int, help="TODO")
     parser.add_argument("-o", "--output", default="output.png", help="TODO")
+    parser.add_argument(
+        "--fast-png",
+        action="store_true",
+        help="Use the lowest PNG compression level, which is faster but produces a larger file",
+    )
     parser.add_argument(
         "--log-level",
         choices=["verbose", "debug", "info", "warning", "error", "critical"],
         default="warning",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    return _parser().parse_args()
 
 
 class Unit(str, Enum):
@@ -74,7 +87,25 @@ class Unit(str, Enum):
     BYTES = "byte"
 
 
+class BitsKind(IntEnum):
+    RANGE = 0
+    SET = 1
+    SINGLE = 2
+
+
 class Field:
+    __slots__ = (
+        "name",
+        "bits",
+        "kind",
+        "min",
+        "max",
+        "display_bits",
+        "start_label",
+        "end_label",
+        "unit",
+    )
+
     def __init__(
         self,
         name,
@@ -84,15 +115,23 @@ class Field:
         end_label=None,
         unit=Unit.BITS,
     ) -> None:
+        # The kind of `bits` is determined once here so that nothing else needs to check
+        # its type
         if isinstance(bits, tuple):
             assert len(bits) == 2
+            self.kind = BitsKind.RANGE
             self.min = bits[0]
             self.max = bits[1]
-        elif isinstance(bits, list):
-            sorted_bits = sorted(bits)
-            self.min = sorted_bits[0]
-            self.max = sorted_bits[1]
+        elif isinstance(bits, (list, set, frozenset)):
+            # A set of values is stored as a frozenset so that it can be used as a cache
+            # key
+            bits = frozenset(bits)
+            assert len(bits) > 1
+            self.kind = BitsKind.SET
+            self.min = min(bits)
+            self.max = max(bits)
         elif isinstance(bits, int):
+            self.kind = BitsKind.SINGLE
             self.min = bits
             self.max = bits
         else:
@@ -109,79 +148,96 @@ class Field:
         self.unit = unit
 
 
-def get_bit_label(bits, unit):
-    if isinstance(bits, tuple):
-        # A range from min to max
-        assert len(bits) == 2
-        return f"{bits[0]} - {bits[1]} {unit}s"
-    elif isinstance(bits, list):
-        # A set of specific values
-        assert len(bits) > 1
-        str_bits = list(map(str, bits))
-        return ", ".join(str_bits[:-1]) + f" or {str_bits[-1]} {unit}s"
-    elif isinstance(bits, int):
-        # A single value
-        s = f"{bits} {unit}"
-        if bits != 1:
-            s += "s"
-
-        return s
-    else:
-        assert False
+def _range_label(bits, unit):
+    # A range from min to max
+    return f"{bits[0]} - {bits[1]} {unit}s"
+
+
+def _set_label(bits, unit):
+    # A set of specific values
+    *rest, last = sorted(bits)
+    return f"{', '.join(map(str, rest))} or {last} {unit}s"
+
+
+def _single_label(bits, unit):
+    # A single value
+    suffix = "" if bits == 1 else "s"
+    return f"{bits} {unit}{suffix}"
+
+
+_BIT_LABELS = {
+    BitsKind.RANGE: _range_label,
+    BitsKind.SET: _set_label,
+    BitsKind.SINGLE: _single_label,
+}
+
+
+@cache
+def get_bit_label(kind, bits, unit):
+    return _BIT_LABELS[kind](bits, unit)
 
 
+@cache
 def phys_fields():
-    return "Bluetooth BR/EDR Packet", [
+    return "Bluetooth BR/EDR Packet", (
         Field("Access Code", [68, 72], 3),
         Field("Packet\nHeader", 54, 2),
         Field("Payload", (0, 2790), 6),
-    ]
+    )
 
 
+@cache
 def packet_header_fields():
-    return "Bluetooth BR/EDR Packet Header", [
+    return "Bluetooth BR/EDR Packet Header", (
         Field("LT_ADDR", 3),
         Field("Type", 4),
         Field("Flow", 1),
         Field("ARQN", 1),
         Field("SEQN", 1),
         Field("HEC", 8, 6),
-    ]
+    )
 
 
+@cache
 def payload_header_fields():
-    return "Bluetooth BR/EDR Payload Header", [
+    return "Bluetooth BR/EDR Payload Header", (
         Field("LLID", 2),
         Field("Flow", 1),
         Field("Length", 5),
-    ]
+    )
 
 
+@cache
 def acl_payload_format_fields():
-    return "Bluetooth ACL Payload", [
+    return "Bluetooth ACL Payload", (
         Field("Payload\nHeader", 8, 2),
         Field("Payload Body", (0, 2790), 6),
         Field("MIC", 32, 4),
         Field("CRC", 16, 3),
-    ]
+    )
 
 
+@cache
 def bdaddr_fields():
-    return "Bluetooth Device Address", [
+    return "Bluetooth Device Address", (
         Field("NAP", 16),
         Field("UAP", 8),
         Field("LAP", 24),
-    ]
+    )
 
 
 def create_canvas(
     title, fields, bit_width: int, mode: Mode, endianness: Endianness, style: Style
 ) -> Canvas:
     small_font_size = int(style.font_size * 0.6)
+    # `style.padding` looks through the style's parents on every access, so read it once
+    padding = style.padding
+    is_width = mode is Mode.WIDTH
+    is_little = endianness is Endianness.LITTLE
 
     c = Canvas()
 
-    v = c.vlayout(align=Align.CENTER, width=c.width - style.padding)
+    v = c.vlayout(align=Align.CENTER, width=c.width - padding)
 
     # Title
     logger.info("Laying out title")
@@ -191,13 +247,15 @@ def create_canvas(
     logger.info("Laying out LSB/MSB")
     lsb_msb = c.hlayout()
 
-    if endianness == Endianness.LITTLE:
+    if is_little:
         left_text = "LSB"
         right_text = "MSB"
     else:
         left_text = "MSB"
         right_text = "LSB"
-        fields.reverse()
+        # The fields may be shared with other callers, so don't reverse them in place.
+        # They are only iterated once, so there's no need to copy them either
+        fields = reversed(fields)
 
     t = Table(canvas=c)
 
@@ -222,60 +280,56 @@ def create_canvas(
 
     v.add(lsb_msb)
 
-    # Table
-    logger.info("Laying out table")
-
-    for field in fields:
-        cell_width = bit_width * field.display_bits
-        text = f"{field.name}\n({field.max})"
-        if mode == Mode.WIDTH:
-            text = f"{field.name}"
-        t.add(
-            c.textbox(
-                text,
-                align=Align.CENTER,
-                width=cell_width,
-            )
-        )
-
-    # Labels
-    logger.info("Laying out labels")
+    # Table and labels
+    logger.info("Laying out table and labels")
     h = c.hlayout()
+    cells = []
+    labels = []
     current_bit = 0
     for field in fields:
         cell_width = bit_width * field.display_bits
 
-        if mode == Mode.WIDTH:
-            label = get_bit_label(field.bits, field.unit.value)
-            label_tb = c.textbox(label, stroke_width=1, font_size=small_font_size)
+        if is_width:
+            text = f"{field.name}"
+        else:
+            text = f"{field.name}\n({field.max})"
+        cells.append(c.textbox(text, align=Align.CENTER, width=cell_width))
 
-            h.add(c.dotted_line(vec=P(0, h.height - style.padding)))
+        if is_width:
+            label = get_bit_label(field.kind, field.bits, field.unit.value)
+            label_tb = c.textbox(label, stroke_width=1, font_size=small_font_size)
 
             # The length of the arrow is the size of the field cell minus the size of
             # the label, minus one padding per arrow, divided by two for two arrows. We
             # only account for one padding per arrow because the padding between the
             # label and the arrow is included in the label width
-            arrow_length = (cell_width - label_tb.width - (style.padding * 2)) / 2
+            arrow_length = (cell_width - label_tb.width - (padding * 2)) / 2
 
             # TODO: Constant arrowhead length instead of ratio
             arrow1 = c.arrow(double_sided=True, vec=P(arrow_length, 0))
             # TODO: arrow2 = arrow1.clone(True)
             arrow2 = c.arrow(double_sided=True, vec=P(arrow_length, 0))
 
-            h.add(c.spacer())
-            h.add(arrow1)
-            h.add(label_tb)
-            h.add(arrow2)
-            h.add(c.spacer())
+            labels += (
+                c.dotted_line(vec=P(0, h.height - padding)),
+                c.spacer(),
+                arrow1,
+                label_tb,
+                arrow2,
+                c.spacer(),
+            )
         else:
-            h.add(c.textbox(str(current_bit), width=cell_width))
+            labels.append(c.textbox(str(current_bit), width=cell_width))
 
         current_bit += field.max
 
-    h.add(c.dotted_line(vec=P(0, h.height - style.padding)))
+    labels.append(c.dotted_line(vec=P(0, h.height - padding)))
+
+    t.extend(cells)
+    h.extend(labels)
 
     v.add(t)
-    v.add(h, offset=P(0, style.padding))
+    v.add(h, offset=P(0, padding))
 
     c.add(v)
 
@@ -310,10 +364,17 @@ def main() -> None:
     # title, fields = acl_payload_format_fields()
 
     if args.relative:
-        display_bits = list(map(lambda f: f.display_bits, fields))
-        gcd = math.gcd(*display_bits)
-        fields = list(
-            map(lambda f: Field(f.name, f.bits, f.display_bits // gcd), fields)
+        gcd = math.gcd(*(f.display_bits for f in fields))
+        fields = tuple(
+            Field(
+                f.name,
+                f.bits,
+                f.display_bits // gcd,
+                f.start_label,
+                f.end_label,
+                f.unit,
+            )
+            for f in fields
         )
         if gcd == 1:
             logger.warning("Warning: gcd is 1")
@@ -338,9 +399,15 @@ def main() -> None:
     if args.crop:
         renderer.crop(dim=canvas.dim, offset=canvas.pos)
 
-    if not args.no_show:
-        renderer.show()
-    renderer.output(args.output)
+    # `show` encodes the image to a temporary file too, so the output file is written
+    # in the background at the same time
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        output = executor.submit(
+            renderer.output, args.output, compress_level=1 if args.fast_png else 6
+        )
+        if not args.no_show:
+            renderer.show()
+        output.result()
 
 
 if __name__ == "__main__":
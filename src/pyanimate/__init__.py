@@ -1,6 +1,7 @@
-import inspect
 import logging
 import os
+import sys
+from types import FrameType
 
 try:
     from rich.traceback import install
@@ -13,27 +14,52 @@ VERBOSE = logging.DEBUG - 5
 logging.VERBOSE = VERBOSE  # type: ignore[attr-defined]
 
 
+def _caller_frame() -> FrameType:
+    """
+    Find the frame that made the logging call currently being formatted.
+
+    Returns:
+    - FrameType, the innermost frame that isn't part of `logging` or this module
+    """
+    # Skip frames until we leave the logging infrastructure. The number of frames to
+    # skip isn't fixed, it depends on which logging method was called.
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame.f_code.co_filename in _LOGGING_FILES:
+        assert frame.f_back is not None
+        frame = frame.f_back
+
+    return frame
+
+
+def _stack_depth(frame: FrameType | None) -> int:
+    depth = 0
+    while frame is not None:
+        frame = frame.f_back
+        depth += 1
+
+    return depth
+
+
 class IndentFormatter(logging.Formatter):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.base_depth = None
 
     def format(self, rec: logging.LogRecord) -> str:
-        stack: list[inspect.FrameInfo] = inspect.stack()
-
-        # We need to skip 8 stack frames of the logging infrastructure to get to the
-        # real stack frame
-        frame = stack[8]
+        # Only the caller's frame is looked up, since `inspect.stack()` would also read
+        # the source of every frame on the stack
+        frame = _caller_frame()
+        depth = _stack_depth(frame)
 
         # We assume that the first time we call the logger we are at the base depth
         # TODO: Is there a more robust way to do this?
         if self.base_depth is None:
             # We want the indent to be 1 for the first call, so if `base_depth` is set
-            # as below, then the indent is `len(stack) - 8 - (len(stack) - 8 - 1) = 1`
-            self.base_depth = len(stack) - 8 - 1
+            # as below, then the indent is `depth - (depth - 1) = 1`
+            self.base_depth = depth - 1
 
-        rec.indent = " " * (len(stack) - 8 - self.base_depth)
-        rec.funcName = frame.function
+        rec.indent = " " * (depth - self.base_depth)
+        rec.funcName = frame.f_code.co_name
         out = logging.Formatter.format(self, rec)
         first, *rest = out.split("]")
         first, second = first.split(" - ")
@@ -45,13 +71,10 @@ class IndentFormatter(logging.Formatter):
 
 class AlignFormatter(logging.Formatter):
     def format(self, rec: logging.LogRecord) -> str:
-        stack: list[inspect.FrameInfo] = inspect.stack()
-        # We need to skip 8 stack frames of the logging infrastructure to get to the
-        # real stack frame
-        frame = stack[8]
+        frame = _caller_frame()
 
         # TODO: Also need to update filename
-        rec.funcName = frame.function
+        rec.funcName = frame.f_code.co_name
         out = logging.Formatter.format(self, rec)
         first, *rest = out.split("]")
         first, second = first.split(" - ")
@@ -75,8 +98,25 @@ class CustomLogger(logging.getLoggerClass()):
 
 logging.setLoggerClass(CustomLogger)
 
+_LOGGING_FILES = frozenset(
+    (logging.Formatter.format.__code__.co_filename, _caller_frame.__code__.co_filename)
+)
+
+
+# Loggers that `get_logger` has already set up, by name, along with whether they indent
+# their messages. `logging.getLogger` returns the same logger for a name every time, so
+# setting it up again would attach a second handler and print every message twice.
+_loggers: dict[str, tuple[CustomLogger, bool]] = {}
+
 
 def get_logger(name: str, *, indent: bool = False) -> CustomLogger:
+    if name in _loggers:
+        logger, logger_indent = _loggers[name]
+        assert (
+            indent == logger_indent
+        ), f"Logger {name} already set up with indent={logger_indent}"
+        return logger
+
     log_level = os.getenv("PYANIMATE_LOG_LEVEL", None)
 
     if log_level and log_level.upper() not in logging.getLevelNamesMapping():
@@ -117,4 +157,6 @@ def get_logger(name: str, *, indent: bool = False) -> CustomLogger:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 
+    _loggers[name] = (logger, indent)  # type: ignore
+
     return logger  # type: ignore
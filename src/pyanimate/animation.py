@@ -1,15 +1,64 @@
+import logging
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
-from . import get_logger
+from . import VERBOSE, get_logger
+from .easing import Easing, linear
 from .layout import Object, ObjectProxy, _Proxy
 from .shape import Color
 from .shape import Point as P
 
 logger = get_logger(__name__)
 
+NS_PER_SEC = 1_000_000_000
+
+# Colors are interpolated in linear light instead of directly on the sRGB encoded
+# values, otherwise the midpoint between two colors comes out too dark. The lookup
+# tables convert between 8 bit sRGB and 12 bit linear values, which is the smallest
+# precision at which every sRGB value survives the round trip unchanged.
+_LINEAR_MAX = 4095
+
+
+def _srgb_to_linear(c: float) -> float:
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(v: float) -> float:
+    return v * 12.92 if v <= 0.0031308 else 1.055 * v ** (1 / 2.4) - 0.055
+
+
+_SRGB_TO_LINEAR = tuple(
+    round(_srgb_to_linear(c / 255) * _LINEAR_MAX) for c in range(256)
+)
+_LINEAR_TO_SRGB = tuple(
+    round(_linear_to_srgb(v / _LINEAR_MAX) * 255) for v in range(_LINEAR_MAX + 1)
+)
+
+# Color channels are interpolated together by packing each channel into its own lane
+# of a single int. During interpolation a lane holds `start * 256 + diff * t` (plus a
+# rounding bias of 128) for `t` between 0 and 256. This is never negative and always
+# fits in 20 bits, so 24 bit lanes never carry into each other even though `diff` can
+# be negative.
+_LANE_BITS = 24
+
+_new_tuple = tuple.__new__
+
+
+def _pack_channels(channels: tuple[int, ...]) -> int:
+    return sum(c << (i * _LANE_BITS) for i, c in enumerate(channels))
+
+
+def _linearize(color: Color) -> tuple[int, int, int, int]:
+    # Alpha is not gamma encoded, so it is left as is
+    r, g, b, a = color
+    return _SRGB_TO_LINEAR[r], _SRGB_TO_LINEAR[g], _SRGB_TO_LINEAR[b], a
+
 
 class Animation(ABC):
+    # Every animation in a scene is stepped once per frame, so animations use slots
+    # instead of a `__dict__` for faster attribute access
+    __slots__ = ("duration", "_inv_duration", "elapsed_time", "dirty")
+
     def __init__(self, duration: float = 1.0) -> None:
         """
         Initialize an Animation object.
@@ -20,14 +69,54 @@ class Animation(ABC):
         Attributes:
         - duration: float, the duration of the animation in seconds
         - elapsed_time: float, the elapsed time of the animation in seconds
+        - dirty: bool, whether the last call to `step` changed anything that is rendered
         """
+        # A zero length animation would never be stepped, and the progress of a
+        # group's children is scaled by their durations
+        assert duration > 0, "Animation duration must be positive"
         self.duration: float = duration
+        self._inv_duration = 1.0 / duration
         self.elapsed_time: float = 0.0
+        self.dirty: bool = True
 
     @abstractmethod
-    def step(self) -> None:
+    def step(self, progress: float) -> None:
+        """
+        Update the state of the animation.
+
+        Args:
+        - progress: float, the progress of the animation (between 0 and 1)
+        """
         raise NotImplementedError()
 
+    def frames(self, frame_rate: int) -> Iterator[float]:
+        """
+        Iterate over the frames of the animation.
+
+        Args:
+        - frame_rate: int, the number of frames per second
+
+        Returns:
+        - iterator of floats, the progress of the animation at each frame
+
+        The caller is responsible for calling `step` with each progress value and
+        rendering the frame, which lets a single loop (e.g. in `Scene.play`) drive
+        every animation.
+        """
+        # The time of each frame is derived from its index instead of accumulating a
+        # frame duration, so floating point error doesn't build up over long
+        # animations. The number of frames is computed with integer nanoseconds so
+        # that e.g. a 0.3 second animation at 10 fps is exactly 3 frames.
+        duration_ns = round(self.duration * NS_PER_SEC)
+        num_frames = -(-duration_ns * frame_rate // NS_PER_SEC)
+
+        for frame_idx in range(num_frames):
+            self.elapsed_time = frame_idx / frame_rate
+            progress = self.elapsed_time * self._inv_duration
+            yield progress if progress < 1.0 else 1.0
+
+        self.elapsed_time = self.duration
+
     def play(self, render: Callable[[], None], frame_rate: int = 50) -> None:
         """
         Play the animation.
@@ -38,45 +127,66 @@ class Animation(ABC):
 
         This method plays the animation by repeatedly calling the `step` method and the `render` function.
         """
-        frame_duration = 1 / frame_rate
-
-        while self.elapsed_time < self.duration:
-            self.step()
-            # TODO: is there a better way to render other than a callback?
+        for progress in self.frames(frame_rate):
+            self.step(progress)
             render()
-            self.elapsed_time += frame_duration
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(duration={self.duration})"
 
 
 class AnimationGroup(Animation):
-    def __init__(self, animations: list[Animation], **kwargs) -> None:
+    __slots__ = ("animations", "progress_scales", "_dynamic")
+
+    def __init__(self, animations: Iterable[Animation], **kwargs) -> None:
         """
         Initialize an AnimationGroup object.
 
         Args:
-        - animations: list of Animation objects
+        - animations: iterable of Animation objects
 
         Attributes:
-        - animations: list of Animation objects
+        - animations: tuple of Animation objects. The duration, progress scales and
+          the animations that are stepped are computed from these once, so the group
+          can't be changed after it's created.
         - duration: float, the duration of the animation in seconds (the maximum duration of all animations)
+        - progress_scales: tuple of floats, the factor that converts the progress of the
+          group into the progress of each child animation
         """
         super().__init__(**kwargs)
-        self.animations = animations
-        self.duration = max(anim.duration for anim in animations)
+        self.animations = tuple(animations)
+        self.duration = max(anim.duration for anim in self.animations)
+        self._inv_duration = 1.0 / self.duration
+        self.progress_scales = tuple(
+            self.duration / anim.duration for anim in self.animations
+        )
+
+        # Static animations never change anything, so they are left out of `step`.
+        # Transforms whose start and end values are equal are still stepped, as their
+        # first step sets the object to the start value.
+        self._dynamic = tuple(
+            (anim, scale)
+            for anim, scale in zip(self.animations, self.progress_scales)
+            if not isinstance(anim, StaticAnimation)
+        )
 
-    def step(self) -> None:
+    def step(self, progress: float) -> None:
         """
         Update the state of all child animations by calling their `step` methods.
         """
-        for anim in self.animations:
-            # TODO: Is there a better way then setting this field manually?
-            anim.elapsed_time = self.elapsed_time
-            anim.step()
+        dirty = False
+        for anim, scale in self._dynamic:
+            child_progress = progress * scale
+            anim.step(child_progress if child_progress < 1.0 else 1.0)
+            if anim.dirty:
+                dirty = True
+
+        self.dirty = dirty
 
 
 class StaticAnimation(Animation):
+    __slots__ = ("obj",)
+
     def __init__(self, obj: Object, **kwargs) -> None:
         """
         Initialize a StaticAnimation object.
@@ -92,12 +202,22 @@ class StaticAnimation(Animation):
         assert isinstance(obj, _Proxy)
         self.obj: Object = obj.latest()
 
-    def step(self) -> None:
-        pass
+    def step(self, progress: float) -> None:
+        self.dirty = False
 
 
 class Transform(Animation):
-    def __init__(self, obj: Object | ObjectProxy, start_val, end_val, **kwargs) -> None:
+    __slots__ = ("obj", "start_val", "val_diff", "easing", "_finished", "_interpolate")
+
+    def __init__(
+        self,
+        obj: Object | ObjectProxy,
+        start_val,
+        end_val,
+        *,
+        easing: Easing = linear,
+        **kwargs,
+    ) -> None:
         """
         Initialize a Transform object.
 
@@ -105,25 +225,50 @@ class Transform(Animation):
         - obj: Object, the object to transform
         - start_val: float or tuple of floats, the start value of the transform
         - end_val: float or tuple of floats, the end value of the transform
+        - easing: function, maps the progress of the animation to the progress of the
+          transform (see `pyanimate.easing`)
 
         Attributes:
         - obj: Object, the object to transform
         - start_val: float or tuple of floats, the start value of the transform
         - val_diff: float or tuple of floats, the difference between the end value and the start value
+        - easing: function, the easing function of the transform
         """
         super().__init__(**kwargs)
+        # Subclasses pass the proxy through, so it is only resolved here
         if isinstance(obj, _Proxy):
             obj = obj.latest()
         self.obj: Object = obj
         self.start_val = start_val
         self.val_diff = end_val - start_val
+        self.easing = easing
+        self._finished = False
 
-    def step(self) -> None:
+        # The type of the values doesn't change over the transform, so the way they're
+        # interpolated is picked once here instead of every frame
+        # TODO: Remove this special case
+        if isinstance(self.val_diff, (Color, P)):
+            self._interpolate = self._interpolate_shape
+        else:
+            self._interpolate = self._interpolate_number
+
+    def step(self, progress: float) -> None:
         """
         Calculate the new value of the transform and update the object by calling the `update_val` method.
         """
-        progress = self.elapsed_time / self.duration
-        new_val = self.calculate_new_val(progress)
+        # Progress is clamped to 1 by the caller. A transform in an `AnimationGroup`
+        # that is shorter than the group keeps getting stepped at 1 after it finishes,
+        # and there's nothing left to do once the end value has been applied.
+        if self._finished and progress >= 1.0:
+            self.dirty = False
+            return
+
+        self._finished = progress >= 1.0
+        # `update_val` may clear this if the value is unchanged. It has to be set here
+        # as the short-circuit above clears it, and a transform can be replayed.
+        self.dirty = True
+
+        new_val = self.calculate_new_val(self.easing(progress))
         self.update_val(new_val)
 
     def calculate_new_val(self, progress: float):
@@ -136,17 +281,17 @@ class Transform(Animation):
         Returns:
         - float or tuple of floats, the new value of the transform
         """
-        # TODO: Remove this special case
-        if isinstance(self.val_diff, (Color, P)):
+        return self._interpolate(progress)
+
+    def _interpolate_shape(self, progress: float):
+        scaled_diff = self.val_diff.mul(progress)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                "%s %s %s %s",
-                self.start_val,
-                self.val_diff,
-                progress,
-                self.val_diff.mul(progress),
+                "%s %s %s %s", self.start_val, self.val_diff, progress, scaled_diff
             )
-            return self.start_val + (self.val_diff.mul(progress))
+        return self.start_val + scaled_diff
 
+    def _interpolate_number(self, progress: float):
         return self.start_val + (self.val_diff * progress)
 
     @abstractmethod
@@ -155,6 +300,8 @@ class Transform(Animation):
 
 
 class StyleTransform(Transform):
+    __slots__ = ("property_name", "_style", "_last_val")
+
     def __init__(
         self,
         obj: Object | ObjectProxy,
@@ -174,70 +321,119 @@ class StyleTransform(Transform):
 
         Attributes:
         - obj: Object, TODO
+        - property_name: str, the name of the style property to update
         """
-        if isinstance(obj, _Proxy):
-            obj = obj.latest()
         super().__init__(obj, start_val, end_val, **kwargs)
         self.property_name = property_name
+        # The style is looked up once here instead of through `self.obj` every frame.
+        # Objects never have their style replaced (cloning creates a new object), so
+        # this is always the style that gets rendered.
+        self._style = self.obj.style
+        self._last_val = None
 
     def update_val(self, val) -> None:
+        # Style values are always plain numbers or colors, so it's cheap to check if
+        # the frame will actually look any different
+        self.dirty = val != self._last_val
+        if not self.dirty:
+            return
+
+        self._last_val = val
+
         # TODO: style should be immutable? but creating a new style object every
         # frame is expensive
-        logger.verbose(
-            "Updating %s.style.%s to %s",
-            self.obj.__class__.__name__,
-            self.property_name,
-            val,
-        )
-        setattr(self.obj.style, self.property_name, val)
+        if logger.isEnabledFor(VERBOSE):
+            logger.verbose(
+                "Updating %s.style.%s to %s",
+                self.obj.__class__.__name__,
+                self.property_name,
+                val,
+            )
+        setattr(self._style, self.property_name, val)
 
 
 class RgbTransform(StyleTransform):
+    __slots__ = ("_start_packed", "_diff_packed")
+
     def __init__(
         self, obj: Object | ObjectProxy, start_color: Color, end_color: Color, **kwargs
     ) -> None:
-        if isinstance(obj, _Proxy):
-            obj = obj.latest()
         super().__init__(obj, start_color, end_color, "_fill_color", **kwargs)
 
+        sr, sg, sb, sa = start = _linearize(start_color)
+        er, eg, eb, ea = _linearize(end_color)
+        # The start value is pre-scaled by 256 so that progress can be applied as an
+        # integer between 0 and 256. Adding 128 to every lane makes the final shift
+        # round to the nearest value instead of truncating.
+        self._start_packed = (_pack_channels(start) << 8) + _pack_channels((128,) * 4)
+        self._diff_packed = _pack_channels((er - sr, eg - sg, eb - sb, ea - sa))
+
     def calculate_new_val(self, progress: float) -> Color:
-        new_color = tuple(
-            int(y + z)
-            for y, z in zip(self.start_val, tuple(x * progress for x in self.val_diff))
+        # Easing functions can overshoot, but the lanes only stay separate for progress
+        # between 0 and 1, and a color can't go past its start or end anyway
+        if progress < 0.0:
+            progress = 0.0
+        elif progress > 1.0:
+            progress = 1.0
+
+        # One multiply-add interpolates all four channels at once
+        mixed = (self._start_packed + self._diff_packed * int(progress * 256)) >> 8
+        # This is what `Color.__new__` does, without the extra Python call per frame
+        return _new_tuple(
+            Color,
+            (
+                _LINEAR_TO_SRGB[mixed & _LINEAR_MAX],
+                _LINEAR_TO_SRGB[(mixed >> _LANE_BITS) & _LINEAR_MAX],
+                _LINEAR_TO_SRGB[(mixed >> (2 * _LANE_BITS)) & _LINEAR_MAX],
+                (mixed >> (3 * _LANE_BITS)) & 0xFF,
+            ),
         )
-        return Color(*new_color)
 
 
 class AlphaTransform(StyleTransform):
+    __slots__ = ()
+
     def __init__(
         self, obj: Object | ObjectProxy, start_alpha: int, end_alpha: int, **kwargs
     ) -> None:
-        if isinstance(obj, _Proxy):
-            obj = obj.latest()
         super().__init__(obj, start_alpha, end_alpha, "_alpha", **kwargs)
 
+    def calculate_new_val(self, progress: float) -> int:
+        # Easing functions can overshoot, which would take alpha out of 0 to 255
+        if progress < 0.0:
+            progress = 0.0
+        elif progress > 1.0:
+            progress = 1.0
+
+        # `Style.alpha` truncates to an integer anyway, so doing it here doesn't change
+        # what's rendered, but it means frames that round to the same alpha as the
+        # previous frame aren't dirty
+        return int(self.start_val + self.val_diff * progress)
+
 
 class FadeIn(AlphaTransform):
+    __slots__ = ()
+
     def __init__(
         self, obj: Object | ObjectProxy, start_alpha=0, end_alpha=255, **kwargs
     ) -> None:
         assert start_alpha < end_alpha
-        if isinstance(obj, _Proxy):
-            obj = obj.latest()
         super().__init__(obj, start_alpha, end_alpha, **kwargs)
 
 
 class FadeOut(AlphaTransform):
+    __slots__ = ()
+
     def __init__(
         self, obj: Object | ObjectProxy, start_alpha=255, end_alpha=0, **kwargs
     ) -> None:
         assert start_alpha > end_alpha
-        if isinstance(obj, _Proxy):
-            obj = obj.latest()
         super().__init__(obj, start_alpha, end_alpha, **kwargs)
 
 
 class Translate(Transform):
+    __slots__ = ()
+
     def __init__(
         self, obj: Object | ObjectProxy, dest: P, *, relative=False, **kwargs
     ) -> None:
@@ -250,15 +446,18 @@ class Translate(Transform):
             self.val_diff = dest
 
     def update_val(self, val) -> None:
+        # The parent is looked up every frame, as the object may have been removed
+        # from it since the transform was created
         parent = self.obj.parent
         assert parent is not None
-        logger.debug(
-            "Updating %s offset (parent %s) from %r to %r",
-            self.obj,
-            parent,
-            parent.children[self.obj],
-            val,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updating %s offset (parent %s) from %r to %r",
+                self.obj,
+                parent,
+                parent.children[self.obj],
+                val,
+            )
         parent.children[self.obj] = val
 
 
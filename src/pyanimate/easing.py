@@ -0,0 +1,70 @@
+from array import array
+from typing import Callable, TypeAlias
+
+# An easing function maps the linear progress of an animation (between 0 and 1) to the
+# progress that should be applied to the animated value. All easing functions must
+# return 0 for 0 and 1 for 1. In between they may go outside of 0 and 1 (e.g. to
+# overshoot the end value), except for colors and alpha, which clamp the eased progress
+# to between 0 and 1.
+Easing: TypeAlias = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    return t * t
+
+
+def ease_out_quad(t: float) -> float:
+    return 1 - (1 - t) * (1 - t)
+
+
+def ease_in_out_quad(t: float) -> float:
+    if t < 0.5:
+        return 2 * t * t
+
+    return 1 - ((-2 * t + 2) ** 2) / 2
+
+
+def ease_in_cubic(t: float) -> float:
+    return t * t * t
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    if t < 0.5:
+        return 4 * t * t * t
+
+    return 1 - ((-2 * t + 2) ** 3) / 2
+
+
+def tabulate(easing: Easing, size: int = 1024) -> Easing:
+    """
+    Precompute an easing function into a lookup table.
+
+    Args:
+    - easing: function, the easing function to precompute
+    - size: int, the number of entries in the table
+
+    Returns:
+    - function, an easing function that looks up the closest entry in the table instead
+      of evaluating `easing`
+
+    This is useful for easing functions that are expensive to evaluate. With the default
+    size the progress is rounded to the nearest 1/1023, which for the easing functions in
+    this module changes the result by less than one step of an 8 bit color or alpha
+    value.
+    """
+    assert size >= 2
+    last = size - 1
+    table = array("d", (easing(i / last) for i in range(size)))
+
+    def lookup(t: float) -> float:
+        return table[round(t * last)]
+
+    return lookup
@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import logging
 import math
 import sys
-import uuid
-from collections import OrderedDict
 from copy import deepcopy
 from enum import Enum
-from typing import Generic, Self, TypeAlias, TypeVar
+from functools import lru_cache
+from itertools import count
+from typing import Generic, Iterable, Self, TypeAlias, TypeVar
 
 from kiwisolver import UnsatisfiableConstraint
 
 from . import get_logger
 from .renderer import Renderer
+from .shape import ORIGIN
 from .shape import Point as P
-from .solver import Constraint, Solver, Variable
+from .solver import Constraint, Expression, Solver, Variable
 from .style import Anchor, Style
 
+# The `__deepcopy__` overrides of `Object` subclasses assign their own slots on the
+# result of `super().__deepcopy__`, which pylint infers as the base class
+# pylint: disable=assigning-non-slot
+
 logger = get_logger(__name__, indent=True)
 
 
@@ -28,6 +34,28 @@ class Align(str, Enum):
 
 
 class Object:
+    # A scene can contain many objects and their attributes are read for every frame,
+    # so objects use slots instead of a `__dict__`
+    __slots__ = (
+        "_id",
+        "style",
+        "canvas",
+        "cloned_to",
+        "_x",
+        "_y",
+        "_w",
+        "_h",
+        "_width_constraint",
+        "_height_constraint",
+        "children",
+        "parent",
+    )
+
+    # Objects are compared and hashed by ID, and are used as keys of their parent's
+    # `children`, so a small int is used instead of a UUID. Clones keep the ID of the
+    # object they were cloned from.
+    _ids = count()
+
     def __init__(
         self,
         canvas: Canvas,
@@ -45,7 +73,7 @@ class Object:
             # This will inherit from the user-supplied style
             style = style.clone(**kwargs)
 
-        self._id = uuid.uuid4()
+        self._id = next(Object._ids)
 
         self.style = style
         self.canvas = canvas
@@ -57,7 +85,7 @@ class Object:
         self._h = Variable(f"h.{self.name}")
         self._width_constraint = None
         self._height_constraint = None
-        self.children: OrderedDict[Object, P] = OrderedDict()
+        self.children: dict[Object, P] = {}
         self.parent: Object | None = None
 
         if width is not None:
@@ -67,7 +95,7 @@ class Object:
 
     @property
     def name(self):
-        return self.__class__.__name__ + "." + str(self._id)[:4]
+        return self.__class__.__name__ + "." + str(self._id)
 
     @property
     def pos(self) -> P[int]:
@@ -121,7 +149,7 @@ class Object:
         self._height_constraint = self._h == val
         # self.canvas.solver.add(self._height_constraint)
 
-    def add(self, obj: Object | ObjectProxy, offset: P = P(0, 0)) -> None:
+    def add(self, obj: Object | ObjectProxy, offset: P = ORIGIN) -> None:
         if isinstance(obj, _Proxy):
             obj = obj.latest()
 
@@ -132,25 +160,34 @@ class Object:
         obj.parent = self
         obj.style.parent_obj_style = self.style
 
+    def extend(self, objs: Iterable[Object | ObjectProxy], offset: P = ORIGIN) -> None:
+        add = self.add
+        for obj in objs:
+            add(obj, offset)
+
     def remove(self, obj: Object | ObjectProxy) -> None:
         if isinstance(obj, _Proxy):
             obj = obj.latest()
 
-        if obj not in self.children:
-            raise ValueError(f"Object {obj} not found")
+        try:
+            del self.children[obj]
+        except KeyError:
+            raise ValueError(f"Object {obj} not found") from None
 
-        del self.children[obj]
         obj.parent = None
 
     def prepare_impl(self, _renderer: Renderer) -> None:
+        # Constraints are built from the underlying variables instead of the `x`, `y`,
+        # `width` and `height` properties. The properties update the solver so that
+        # their values can be read, which would re-solve the layout after every added
+        # constraint. Nothing reads a value while constraints are being added, and the
+        # solver is updated on the next read.
         for obj, offset in self.children.items():
-            c = self.x + offset.x == obj.x
+            c = self._x + offset.x == obj._x
             self.canvas.solver.add(c)
-            self.canvas.solver.update()
 
-            c = self.y + offset.y == obj.y
+            c = self._y + offset.y == obj._y
             self.canvas.solver.add(c)
-            self.canvas.solver.update()
 
     def prepare(self, renderer: Renderer) -> None:
         self.canvas.solver.add(self._x >= 0)
@@ -163,21 +200,21 @@ class Object:
         if self._height_constraint:
             self.canvas.solver.add(self._height_constraint)
 
-        self.canvas.solver.update()
-
         logger.debug("Preparing %s", self)
 
         self.prepare_impl(renderer)
 
         for obj, offset in self.children.items():
-            logger.debug("Preparing child %s %s (offset %r)", obj, obj.pos, offset)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Preparing child %s %s (offset %r)", obj, obj.pos, offset)
             obj.prepare(renderer)
 
         logger.debug("Finished preparing %s", self)
 
     def render(self, renderer: Renderer) -> None:
         for obj in self.children:
-            logger.debug("Rendering child %s %s", obj, obj.pos)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rendering child %s %s", obj, obj.pos)
             obj.render(renderer)
 
     def dump(self, indent=0) -> str:
@@ -193,7 +230,7 @@ class Object:
 
         if unique:
             # TODO: We need to update all the variable names?
-            c._id = uuid.uuid4()
+            c._id = next(Object._ids)
             self.cloned_to = None
 
         return c
@@ -213,13 +250,13 @@ class Object:
         # exceptions
         copy._id = self._id
         logger.debug(
-            "copying %s %s %s to %s %s %s",
+            "copying %s %s %#x to %s %s %#x",
             cls.__name__,
             id(self),
-            hex(id(self)),
+            id(self),
             cls.__name__,
             id(copy),
-            hex(id(copy)),
+            id(copy),
         )
 
         memo[id(self)] = copy
@@ -249,9 +286,7 @@ class Object:
 
     def __str__(self) -> str:
         self.canvas.solver.update()
-        return (
-            f"{type(self).__name__}({str(self._id)[:4]}, {self.dim}) [{hex(id(self))}]"
-        )
+        return f"{type(self).__name__}({str(self._id)}, {self.dim}) [{hex(id(self))}]"
 
     def __eq__(self, o: Self) -> bool:
         return self._id == o._id
@@ -300,6 +335,8 @@ def Proxy(target: T) -> T:
 
 # TODO: We can make this class handle even more logic from the subclasses
 class Layout(Object):
+    __slots__ = ("align",)
+
     def __init__(self, align: Align = Align.CENTER, **kwargs) -> None:
         super().__init__(**kwargs)
         self.align = align
@@ -325,74 +362,76 @@ class Layout(Object):
         raise NotImplementedError()
 
     def prepare_impl(self, _renderer: Renderer) -> None:
-        for obj, offset in self.children.items():
-            c = self.get_center_constraint(obj, offset)
-            self.canvas.solver.add(c)
-
-            c = self.get_secondary_dim_constraint(obj, offset)
-            self.canvas.solver.add(c)
-
-            self.canvas.solver.update()
+        add = self.canvas.solver.add
 
         prev_child = None
         for obj, offset in self.children.items():
-            c = self.get_linear_constraint(prev_child, obj, offset)
-            self.canvas.solver.add(c)
+            add(self.get_center_constraint(obj, offset))
+            add(self.get_secondary_dim_constraint(obj, offset))
+            add(self.get_linear_constraint(prev_child, obj, offset))
 
             prev_child = obj
 
-            self.canvas.solver.update()
-
         self.set_primary_dim_constraint()
 
 
 class VLayout(Layout):
+    __slots__ = ()
+
     def get_center_constraint(self, obj: Object, offset: P) -> Constraint:
-        return obj.x == self.x + (self.width / 2) - (obj.width / 2) + offset.x
+        return obj._x == self._x + (self._w / 2) - (obj._w / 2) + offset.x
 
     def get_secondary_dim_constraint(self, obj: Object, offset: P) -> Constraint:
-        return self.width >= obj.width + offset.x
+        return self._w >= obj._w + offset.x
 
     def set_primary_dim_constraint(self) -> None:
-        expr = sum(obj.height + offset.y for obj, offset in self.children.items())
+        expr = Expression.from_sum(
+            obj._h + offset.y for obj, offset in self.children.items()
+        )
         if self._height_constraint:
             self.canvas.solver.remove(self._height_constraint)
-        self._height_constraint = self.height == expr
+        self._height_constraint = self._h == expr
         self.canvas.solver.add(self._height_constraint)
 
     def get_linear_constraint(
         self, prev_obj: Object | None, obj: Object, offset: P
     ) -> Constraint:
         if prev_obj:
-            return obj.y == prev_obj.y + prev_obj.height + offset.y
+            return obj._y == prev_obj._y + prev_obj._h + offset.y
         else:
-            return obj.y == self.y + offset.y
+            return obj._y == self._y + offset.y
 
 
 class HLayout(Layout):
+    __slots__ = ()
+
     def get_center_constraint(self, obj: Object, offset: P) -> Constraint:
-        return obj.y == self.y + (self.height / 2) - (obj.height / 2) + offset.y
+        return obj._y == self._y + (self._h / 2) - (obj._h / 2) + offset.y
 
     def get_secondary_dim_constraint(self, obj, offset) -> Constraint:
-        return self.height >= obj.height + offset.y
+        return self._h >= obj._h + offset.y
 
     def set_primary_dim_constraint(self) -> None:
-        expr = sum(obj.width + offset.x for obj, offset in self.children.items())
+        expr = Expression.from_sum(
+            obj._w + offset.x for obj, offset in self.children.items()
+        )
         if self._width_constraint:
             self.canvas.solver.remove(self._width_constraint)
-        self._width_constraint = self.width == expr
+        self._width_constraint = self._w == expr
         self.canvas.solver.add(self._width_constraint)
 
     def get_linear_constraint(
         self, prev_obj: Object | None, obj: Object, offset: P
     ) -> Constraint:
         if prev_obj:
-            return obj.x == prev_obj.x + prev_obj.width + offset.x
+            return obj._x == prev_obj._x + prev_obj._w + offset.x
         else:
-            return obj.x == self.x + offset.x
+            return obj._x == self._x + offset.x
 
 
 class Rectangle(Object):
+    __slots__ = ()
+
     def render(self, renderer: Renderer) -> None:
         x, y = self.x.value(), self.y.value()
         renderer.rectangle(
@@ -405,6 +444,8 @@ class Rectangle(Object):
 
 
 class Grid(Object):
+    __slots__ = ("step_size",)
+
     def __init__(self, step_size=100, **kwargs) -> None:
         super().__init__(**kwargs)
         self.step_size = step_size
@@ -413,31 +454,34 @@ class Grid(Object):
         if self._width_constraint is None:
             w = renderer.context.w - self.style.padding
             logger.debug("New width for %s: %s", self, w)
-            self._width_constraint = self.width == w
+            self._width_constraint = self._w == w
             self.canvas.solver.add(self._width_constraint)
 
         if self._height_constraint is None:
             h = renderer.context.h - self.style.padding
             logger.debug("New height for %s: %s", self, h)
-            self._height_constraint = self.height == h
+            self._height_constraint = self._h == h
             self.canvas.solver.add(self._height_constraint)
 
     def render(self, renderer: Renderer) -> None:
-        for i in range(0, int(self.width.value()), self.step_size):
-            renderer.line(
-                P(i + self.pos.x, self.pos.y),
-                P(i + self.pos.x, self.height.value()),
-                self.style,
-            )
-        for i in range(0, int(self.height.value()), self.step_size):
-            renderer.line(
-                P(self.pos.x, i + self.pos.y),
-                P(self.width.value(), i + self.pos.y),
-                self.style,
-            )
+        x, y = self.pos
+        width = self.width.value()
+        height = self.height.value()
+
+        segments = [
+            (P(i + x, y), P(i + x, height))
+            for i in range(0, int(width), self.step_size)
+        ]
+        segments += (
+            (P(x, i + y), P(width, i + y))
+            for i in range(0, int(height), self.step_size)
+        )
+        renderer.lines(segments, self.style)
 
 
 class TextBox(Rectangle):
+    __slots__ = ("_text", "_align")
+
     def __init__(self, text: str, align=Align.CENTER, **kwargs) -> None:
         super().__init__(**kwargs)
         self._text = text
@@ -462,18 +506,17 @@ class TextBox(Rectangle):
 
             # For dynamically sized dimensions, we make sure to include room for the
             # padding
+            padding = self.style.padding
             if self._width_constraint is None:
                 logger.debug("New width for %s: %s", self, right)
-                self._width_constraint = self.width == right + self.style.padding * 2
+                self._width_constraint = self._w == right + padding * 2
                 self.canvas.solver.add(self._width_constraint)
 
             if self._height_constraint is None:
                 logger.debug("New height for %s: %s", self, bottom)
-                self._height_constraint = self.height == bottom + self.style.padding * 2
+                self._height_constraint = self._h == bottom + padding * 2
                 self.canvas.solver.add(self._height_constraint)
 
-            self.canvas.solver.update()
-
     def render(self, renderer: Renderer) -> None:
         # We need to call super here first so the text appears on top of the box instead
         # of behind it
@@ -509,15 +552,19 @@ class TextBox(Rectangle):
 
     def __str__(self) -> str:
         self.canvas.solver.update()
-        return f"{type(self).__name__}({str(self._id)[:4]}, {repr(self.text)}, {self.dim}) [{hex(id(self))}]"
+        return f"{type(self).__name__}({str(self._id)}, {repr(self.text)}, {self.dim}) [{hex(id(self))}]"
 
 
 class Table(HLayout):
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
 
 class Line(Object):
+    __slots__ = ("_vec",)
+
     def __init__(self, *, vec: P, **kwargs) -> None:
         super().__init__(**kwargs)
         self._vec = vec
@@ -532,19 +579,18 @@ class Line(Object):
             w = self._vec.x
 
             logger.debug("New width for %s: %s", self, w)
-            self.canvas.solver.add((self.width == w) | "strong")
-            self.canvas.solver.add((self.width == -w) | "strong")
+            self.canvas.solver.add((self._w == w) | "strong")
+            self.canvas.solver.add((self._w == -w) | "strong")
 
         if self._height_constraint is None:
             h = self._vec.y
 
             logger.debug("New height for %s: %s", self, h)
-            self.canvas.solver.add((self.height == h) | "strong")
-            self.canvas.solver.add((self.height == -h) | "strong")
+            self.canvas.solver.add((self._h == h) | "strong")
+            self.canvas.solver.add((self._h == -h) | "strong")
 
     def __deepcopy__(self, memo):
         copy = super().__deepcopy__(memo)
-
         copy._vec = deepcopy(self._vec, memo)
 
         return copy
@@ -556,13 +602,14 @@ class Line(Object):
 
 
 class DottedLine(Line):
+    __slots__ = ("_dash_len",)
+
     def __init__(self, dash_len=10, **kwargs) -> None:
         super().__init__(**kwargs)
         self._dash_len = dash_len
 
     def __deepcopy__(self, memo):
         copy = super().__deepcopy__(memo)
-
         copy._dash_len = self._dash_len
 
         return copy
@@ -573,14 +620,54 @@ class DottedLine(Line):
         length = int(v.mag)
         u = v.unit()
 
+        dash = u.mul(self._dash_len // 2)
+        step = u.mul(self._dash_len)
+
+        segments = []
         xy1 = self.pos
         for _ in range(0, length, self._dash_len):
-            xy2 = xy1 + u.mul(self._dash_len // 2)
-            renderer.line(xy1, xy2, self.style)
-            xy1 = xy1 + u.mul(self._dash_len)
+            segments.append((xy1, xy1 + dash))
+            xy1 = xy1 + step
+
+        renderer.lines(segments, self.style)
+
+
+@lru_cache(maxsize=128)
+def _arrowhead_offsets(vec: P, ratio: float) -> tuple[P, P]:
+    """
+    Compute the offsets of the two sides of an arrowhead from the tip of an arrow.
+
+    Args:
+    - vec: Point, the resolved vector from the start to the end of the arrow
+    - ratio: float, the length of the arrowhead relative to the length of the arrow
+
+    Returns:
+    - tuple of Points, the offsets of the two sides of the arrowhead
+
+    The offsets only depend on the vector of the arrow and not on its position, so
+    they're cached instead of being recomputed every time an arrow is rendered. The
+    cache is bounded, since an arrow whose vector depends on an animated value resolves
+    to a new vector every frame.
+    """
+    head_length = vec.mag * ratio
+    angle = vec.radians
+    head_angle = math.pi / 4  # 45 degrees in radians
+
+    return (
+        P(
+            head_length * math.cos(angle + head_angle),
+            head_length * math.sin(angle + head_angle),
+        ),
+        P(
+            head_length * math.cos(angle - head_angle),
+            head_length * math.sin(angle - head_angle),
+        ),
+    )
 
 
 class Arrow(Line):
+    __slots__ = ("double_sided", "aratio")
+
     def __init__(self, double_sided=False, arrowhead_ratio=0.2, **kwargs) -> None:
         super().__init__(**kwargs)
         self.double_sided = double_sided
@@ -595,34 +682,22 @@ class Arrow(Line):
     def render(self, renderer: Renderer) -> None:
         super().render(renderer)
 
+        vec = self._vec.get()
         start = self.pos
-        end = start + self._vec.get()
-
-        d = end - start
-        length = d.mag
-        angle = d.radians
-
-        head_length = length * self.aratio
-        head_angle = math.pi / 4  # 45 degrees in radians
+        end = start + vec
 
-        head_dx1 = head_length * math.cos(angle + head_angle)
-        head_dy1 = head_length * math.sin(angle + head_angle)
-        head_dx2 = head_length * math.cos(angle - head_angle)
-        head_dy2 = head_length * math.sin(angle - head_angle)
-
-        renderer.line(end, end - P(head_dx1, head_dy1), self.style)
-        renderer.line(end, end - P(head_dx2, head_dy2), self.style)
+        head1, head2 = _arrowhead_offsets(vec, self.aratio)
 
+        segments = [(end, end - head1), (end, end - head2)]
         if self.double_sided:
-            renderer.line(
-                start,
-                start + P(head_dx1, head_dy1),
-                self.style,
-            )
-            renderer.line(start, start + P(head_dx2, head_dy2), self.style)
+            segments += ((start, start + head1), (start, start + head2))
+
+        renderer.lines(segments, self.style)
 
 
 class Spacer(Object):
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
@@ -633,6 +708,8 @@ class Spacer(Object):
 
 
 class Canvas(Object):
+    __slots__ = ("_solver",)
+
     def __init__(self, **kwargs) -> None:
         self._solver = Solver()
         super().__init__(self, **kwargs)
@@ -650,13 +727,13 @@ class Canvas(Object):
         # exceptions
         copy._id = self._id
         logger.verbose(
-            "copying %s %s %s to %s %s %s",
+            "copying %s %s %#x to %s %s %#x",
             self.__class__.__name__,
             id(self),
-            hex(id(self)),
+            id(self),
             copy.__class__.__name__,
             id(copy),
-            hex(id(copy)),
+            id(copy),
         )
 
         memo[id(self)] = copy
@@ -685,7 +762,7 @@ class Canvas(Object):
 
         return copy
 
-    def add(self, obj: Object | _Proxy[Object], offset: P = P(0, 0)) -> None:
+    def add(self, obj: Object | _Proxy[Object], offset: P = ORIGIN) -> None:
         if isinstance(obj, _Proxy):
             obj = obj.latest()
 
@@ -732,6 +809,10 @@ class Canvas(Object):
     def render(self, renderer: Renderer) -> None:
         self.prepare(renderer)
 
+        solver = self.solver
+        add = solver.add
+        w, h = self._w, self._h
+
         # Make sure that children are not rendered outside of the canvas
         try:
             # An implementation detail of kiwisolver is that if adding a constraint
@@ -742,24 +823,22 @@ class Canvas(Object):
             # that limit the maximum size afterwards, so that the smallest solution will
             # still be chosen if there is no constraint violation.
             for obj in self.children:
-                self.solver.add(obj.x + obj.width <= self.width)
-                self.solver.add(obj.y + obj.height <= self.height)
+                add(obj._x + obj._w <= w)
+                add(obj._y + obj._h <= h)
 
-            self.solver.add(self.width <= renderer.context.w)
-            self.solver.add(self.height <= renderer.context.h)
+            add(w <= renderer.context.w)
+            add(h <= renderer.context.h)
         except UnsatisfiableConstraint:
             logger.error("Image exceeds bounds")
-            logger.error("%s", self.solver.dumps())
+            logger.error("%s", solver.dumps())
             sys.exit(1)
 
-        self.solver.update()
+        solver.update()
 
         for obj in self.children:
-            logger.debug(
-                "Rendering %s at %s",
-                obj,
-                obj.pos,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rendering %s at %s", obj, obj.pos)
             obj.render(renderer)
 
-        logger.debug("Finished rendering canvas:\n%s", self.dump())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Finished rendering canvas:\n%s", self.dump())
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterable
 
 from PIL import Image, ImageDraw, ImageFont
 from PIL.ImageFont import FreeTypeFont
 
-from . import get_logger
-from .shape import Color
+from . import VERBOSE, get_logger
+from .shape import ORIGIN, Color
 from .shape import Point as P
 from .style import Style
 
@@ -27,6 +28,10 @@ class RenderContext:
         )
 
 
+# Loading a font parses the font file, so loaded fonts are shared by all renderers
+_fonts: dict[tuple[str, int], FreeTypeFont] = {}
+
+
 class Renderer(ABC):
     @abstractmethod
     def output(self, filename: str | Path) -> None:
@@ -48,6 +53,17 @@ class Renderer(ABC):
     def line(self, p1: P, p2: P, style: Style) -> None:
         raise NotImplementedError()
 
+    def lines(self, segments: Iterable[tuple[P, P]], style: Style) -> None:
+        """
+        Draw many separate line segments with the same style.
+
+        Args:
+        - segments: iterable of (start, end) Points, the line segments to draw
+        - style: Style, the style of every segment
+        """
+        for p1, p2 in segments:
+            self.line(p1, p2, style)
+
     @abstractmethod
     def set_dimensions(self, dim: P) -> None:
         raise NotImplementedError()
@@ -87,7 +103,9 @@ class PILRenderer(Renderer):
 
         self.image = Image.new("RGBA", (self._w, self._h), self.background)
         self.draw = ImageDraw.Draw(self.image)
-        self.fonts: dict[tuple[str, int], FreeTypeFont] = {}
+        # Text is measured every time a canvas is prepared, which is once per frame
+        # when playing a scene, so measurements are cached by text and font
+        self.text_bboxes: dict[tuple[str, str, int], tuple[int, int, int, int]] = {}
 
     @property
     def context(self) -> RenderContext:
@@ -103,10 +121,10 @@ class PILRenderer(Renderer):
 
     def _get_font(self, font: str, font_size: int) -> FreeTypeFont:
         key = (font, font_size)
-        if key not in self.fonts:
-            self.fonts[key] = ImageFont.truetype(*key)
+        if key not in _fonts:
+            _fonts[key] = ImageFont.truetype(*key)
 
-        return self.fonts[key]
+        return _fonts[key]
 
     def _composite_background(self, c: Color, a: int) -> Color:
         return self.background.mul(1 - (a / 255)) + c
@@ -119,7 +137,23 @@ class PILRenderer(Renderer):
     def show(self) -> None:
         self.image.show()
 
-    def output(self, filename: str | Path) -> None:
+    def output(self, filename: str | Path, compress_level: int = 6) -> None:
+        self.save(self.image, filename, compress_level)
+
+    def save(
+        self, image: Image.Image, filename: str | Path, compress_level: int = 6
+    ) -> None:
+        """
+        Save an image that was drawn by this renderer. Unlike `output`, this doesn't
+        read any renderer state that changes between frames, so it is safe to call from
+        another thread after `clear` has started a new image.
+
+        Args:
+        - image: Image, the image to save
+        - filename: str or Path, the file to save the image to
+        - compress_level: int, the zlib compression level used for PNG files, from 0
+          (no compression) to 9. Lower levels are faster but produce larger files
+        """
         # TODO: Font sizes don't seem to be scaled properly
         # self.image = self.image.resize(
         #     (self._w // ctx.scale, self._h // ctx.scale),
@@ -129,9 +163,9 @@ class PILRenderer(Renderer):
         #     logger.warning(
         #         f'Not resizing image, output will be {ctx.scale} times larger than requested'
         #     )
-        self.image.save(filename, dpi=self.ctx.dpi)
+        image.save(filename, dpi=self.ctx.dpi, compress_level=compress_level)
 
-    def crop(self, dim: P[int] | None = None, offset: P[int] = P(0, 0)) -> None:
+    def crop(self, dim: P[int] | None = None, offset: P[int] = ORIGIN) -> None:
         if dim is None:
             width, height = self._w - offset.x, self._h - offset.y
         else:
@@ -156,12 +190,11 @@ class PILRenderer(Renderer):
     def rectangle(self, p1: P, p2: P, style: Style) -> None:
         logger.verbose("Rectangle: %s %s", p1, p2)
 
-        fill_color = self._composite_background(
-            style.composite_fill_color, style.composite_alpha
-        )
-        stroke_color = self._composite_background(
-            style.composite_stroke_color, style.composite_alpha
-        )
+        # The composite alpha is computed by walking up the parent objects' styles, so
+        # it's only computed once for both colors
+        alpha = style.composite_alpha
+        fill_color = self._composite_background(style.composite_fill_color, alpha)
+        stroke_color = self._composite_background(style.composite_stroke_color, alpha)
         self.draw.rectangle(
             (p1.mul(self.ctx.scale), p2.mul(self.ctx.scale)),
             fill=fill_color,
@@ -170,7 +203,7 @@ class PILRenderer(Renderer):
         )
 
     def text(self, text: str, p: P, style: Style) -> None:
-        logger.verbose("Text: %s %s", repr(text), p)
+        logger.verbose("Text: %r %s", text, p)
         font = self._get_font(style.font, int(style.font_size * self.ctx.scale))
         font_color = self._composite_background(
             style.composite_font_color, style.composite_alpha
@@ -186,19 +219,23 @@ class PILRenderer(Renderer):
 
     def text_bbox(self, text: str, style: Style) -> tuple[int, int, int, int]:
         # Since we're returning this information to the caller, we shouldn't scale it
-        font = self._get_font(style.font, int(style.font_size))
-        t = self.draw.textbbox((0, 0), text, font=font)
-        return t
+        key = (text, style.font, int(style.font_size))
+        if key not in self.text_bboxes:
+            font = self._get_font(style.font, int(style.font_size))
+            self.text_bboxes[key] = self.draw.textbbox((0, 0), text, font=font)
+
+        return self.text_bboxes[key]
 
     def line(self, p1: P, p2: P, style: Style) -> None:
         # Dotted line is too verbose
         logger.verbose("Line: %s %s", p1, p2)
-        logger.verbose(
-            "Line scaled by %s: %s %s",
-            self.ctx.scale,
-            p1.mul(self.ctx.scale),
-            p2.mul(self.ctx.scale),
-        )
+        if logger.isEnabledFor(VERBOSE):
+            logger.verbose(
+                "Line scaled by %s: %s %s",
+                self.ctx.scale,
+                p1.mul(self.ctx.scale),
+                p2.mul(self.ctx.scale),
+            )
         stroke_color = self._composite_background(
             style.composite_stroke_color, style.composite_alpha
         )
@@ -209,6 +246,19 @@ class PILRenderer(Renderer):
             width=int(style.stroke_width * self.ctx.scale),
         )
 
+    def lines(self, segments: Iterable[tuple[P, P]], style: Style) -> None:
+        # The stroke color and width are looked up through the style's parents, so they
+        # are only resolved once for all of the segments
+        stroke_color = self._composite_background(
+            style.composite_stroke_color, style.composite_alpha
+        )
+        width = int(style.stroke_width * self.ctx.scale)
+        scale = self.ctx.scale
+
+        line = self.draw.line
+        for p1, p2 in segments:
+            line([p1.mul(scale), p2.mul(scale)], fill=stroke_color, width=width)
+
     def clear(self) -> None:
         self.image = Image.new("RGBA", (self._w, self._h), self.background)
         self.draw = ImageDraw.Draw(self.image)
@@ -1,10 +1,13 @@
 import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import singledispatchmethod
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
 from PIL import GifImagePlugin, Image
 
-from . import get_logger
+from . import VERBOSE, get_logger
 from .animation import Animation, AnimationGroup
 from .layout import Canvas, Proxy
 from .renderer import PILRenderer, RenderContext
@@ -12,6 +15,9 @@ from .renderer import PILRenderer, RenderContext
 logger = get_logger(__name__)
 
 FRAME_DIR = Path(".frames")
+FRAME_COMPRESS_LEVEL = 1
+# The number of frames that can be waiting to be written to disk while playing
+MAX_PENDING_WRITES = 2
 
 default_render_ctx = RenderContext(
     1920,
@@ -28,6 +34,30 @@ class KeyFrame:
         self.animations: list[Animation] = []
 
 
+def _load_frame(path: Path) -> Image.Image:
+    image = Image.open(path)
+    # Loading the image data closes the file
+    image.load()
+    return image
+
+
+class _FrameFiles:
+    """
+    The frames that were written to disk, loaded as they are iterated over. Each
+    frame's file is closed once it has been loaded, instead of every frame file
+    being held open until the output is saved. Pillow keeps the loaded frames around
+    while saving, so this doesn't reduce the memory used. Pillow also iterates over
+    the appended frames more than once when saving some formats, so this can't be a
+    generator.
+    """
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self.paths = list(paths)
+
+    def __iter__(self) -> Iterator[Image.Image]:
+        return map(_load_frame, self.paths)
+
+
 class Scene:
     def __init__(self, render_ctx: RenderContext = default_render_ctx) -> None:
         self.keyframes: list[KeyFrame] = []
@@ -35,6 +65,13 @@ class Scene:
         self.renderer = PILRenderer(render_ctx)
         self.frame_num = 0
 
+        # While playing, frames are written to disk on a background thread so that
+        # encoding one frame overlaps with stepping and drawing the next one. A single
+        # worker keeps the writes in order. Each pending write holds a full frame in
+        # memory, so at most `MAX_PENDING_WRITES` are queued at a time.
+        self._writer: ThreadPoolExecutor | None = None
+        self._pending_writes: deque[Future] = deque()
+
     def keyframe(self) -> Canvas:
         if len(self.keyframes) == 0:
             self.cur_keyframe = KeyFrame(Canvas())
@@ -60,13 +97,64 @@ class Scene:
         logger.info("Rendering frame %d", self.frame_num)
         assert self.cur_keyframe is not None
 
-        logger.verbose("Canvas:\n%s", self.cur_keyframe.canvas.dump())
+        if logger.isEnabledFor(VERBOSE):
+            logger.verbose("Canvas:\n%s", self.cur_keyframe.canvas.dump())
         self.cur_keyframe.canvas.render(self.renderer)
 
-        self.renderer.output(FRAME_DIR / f"frame-{self.frame_num}.png")
+        # `clear` replaces the renderer's image instead of drawing over it, so the
+        # image being written can't be modified by the next frame. Frames are only read
+        # back once to build the output, so they are compressed as little as possible
+        self._write(
+            self.renderer.save,
+            self.renderer.image,
+            self._frame_path(self.frame_num),
+            FRAME_COMPRESS_LEVEL,
+        )
         self.frame_num += 1
         self.renderer.clear()
 
+    def repeat_frame(self) -> None:
+        """
+        Output a copy of the previous frame, for when nothing changed since it was
+        rendered.
+        """
+        logger.info("Repeating frame %d", self.frame_num - 1)
+        assert self.frame_num > 0
+
+        # The previous frame may still be getting written, but the writes happen in
+        # order so it will be finished before it is copied
+        self._write(
+            shutil.copyfile,
+            self._frame_path(self.frame_num - 1),
+            self._frame_path(self.frame_num),
+        )
+        self.frame_num += 1
+
+    @staticmethod
+    def _frame_path(frame_num: int) -> Path:
+        return FRAME_DIR / f"frame-{frame_num}.png"
+
+    def _write(self, func: Callable[..., Any], *args) -> None:
+        if self._writer is None:
+            func(*args)
+        else:
+            pending = self._pending_writes
+
+            # Calling `result` re-raises any exception from the background thread, so
+            # finished writes are checked here instead of after the last frame
+            while pending and pending[0].done():
+                pending.popleft().result()
+
+            if len(pending) >= MAX_PENDING_WRITES:
+                pending.popleft().result()
+
+            pending.append(self._writer.submit(func, *args))
+
+    def _wait_for_writes(self) -> None:
+        # Calling `result` re-raises any exception from the background thread
+        while self._pending_writes:
+            self._pending_writes.popleft().result()
+
     def play(
         self, frame_rate: int = 50, output_filename: str | Path | None = None
     ) -> None:
@@ -77,12 +165,26 @@ class Scene:
 
         FRAME_DIR.mkdir()
 
-        for keyframe in self.keyframes:
-            self.cur_keyframe = keyframe
-            for anim in keyframe.animations:
-                logger.debug("Playing animation %s", anim)
-                anim.play(self.render, frame_rate)
-                logger.debug("Finished animation %s", anim)
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        try:
+            for keyframe in self.keyframes:
+                self.cur_keyframe = keyframe
+                for anim in keyframe.animations:
+                    logger.debug("Playing animation %s", anim)
+                    for i, progress in enumerate(anim.frames(frame_rate)):
+                        anim.step(progress)
+                        # The first frame of an animation always needs to be rendered,
+                        # as the canvas may have changed since the previous animation
+                        if i == 0 or anim.dirty:
+                            self.render()
+                        else:
+                            self.repeat_frame()
+                    logger.debug("Finished animation %s", anim)
+        finally:
+            self._writer.shutdown()
+            self._writer = None
+
+        self._wait_for_writes()
 
         logger.info(
             "Rendered %d frames at %d fps (%s seconds)",
@@ -95,11 +197,7 @@ class Scene:
             self._save(1000 / frame_rate, output_filename)
 
     def _save(self, frame_duration_ms: float, output_filename: str | Path) -> None:
-        images = [
-            Image.open(FRAME_DIR / f"frame-{i}.png") for i in range(0, self.frame_num)
-        ]
-
-        if len(images) == 0:
+        if self.frame_num == 0:
             logger.error("No frames found")
             return
 
@@ -112,10 +210,10 @@ class Scene:
             GifImagePlugin.LOADING_STRATEGY = GifImagePlugin.LoadingStrategy.RGB_ALWAYS
         else:
             disposal = 0
-        images[0].save(
+        _load_frame(self._frame_path(0)).save(
             output_filename,
             save_all=True,
-            append_images=images[1:],
+            append_images=_FrameFiles(map(self._frame_path, range(1, self.frame_num))),
             duration=frame_duration_ms,
             disposal=disposal,
             loop=1,
@@ -28,6 +28,10 @@ UnresolvedShape: TypeAlias = Union[
 
 
 class Shape(tuple[T, ...], Generic[T]):
+    # Shapes are created for nearly every position and size calculation, so they don't
+    # get a `__dict__`
+    __slots__ = ()
+
     def __new__(cls, *args: T) -> Self:
         return tuple.__new__(cls, args)
 
@@ -163,12 +167,20 @@ class Shape(tuple[T, ...], Generic[T]):
         self,
         memo: dict[int, Self],
     ) -> Self:
+        # Shapes are immutable, so a shape of plain numbers can be shared. This is the
+        # common case for offsets and colors, which are copied whenever an object is
+        # cloned
+        if all(isinstance(i, (int, float)) for i in self):
+            return self
+
         # We need to deepcopy a tuple, not the original object, otherwise the
         # deepcopy implementation will not use the tuple's deepcopy method.
         return type(self)(*copy.deepcopy(tuple(self), memo))
 
 
 class Point(Shape[T], Generic[T]):
+    __slots__ = ()
+
     @property
     def x(self) -> T:
         return self[0]
@@ -222,7 +234,12 @@ class Point(Shape[T], Generic[T]):
         return f"{self} [0x{id(self):x}]"
 
 
+ORIGIN = Point(0, 0)
+
+
 class Color(Shape[int]):
+    __slots__ = ()
+
     def __new__(  # pylint: disable=arguments-differ
         cls, r: int, g: int, b: int, a: int = 255
     ) -> Self:
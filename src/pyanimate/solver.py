@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Literal, TypeAlias, Union
+from typing import Iterable, Literal, TypeAlias, Union
 
 import kiwisolver as kiwi
 from kiwisolver import UnsatisfiableConstraint
@@ -275,6 +275,38 @@ class Expression:
     def from_expression(e: kiwi.Expression) -> Expression:
         return Expression(tuple(Term.from_term(t) for t in e.terms()), e.constant())
 
+    @staticmethod
+    def from_sum(items: Iterable[SolverType]) -> Expression:
+        """
+        Sum many values into a single expression.
+
+        Args:
+        - items: iterable of ints, floats, Variables, Terms, or Expressions, the values
+          to sum
+
+        Returns:
+        - Expression, the sum of all of the values
+
+        Using `sum` instead rebuilds the expression after every addition, copying all of
+        the terms collected so far each time, which is quadratic in the number of items.
+        """
+        terms: list[Term] = []
+        constant = 0.0
+        for item in items:
+            if isinstance(item, (int, float)):
+                constant += item
+            elif isinstance(item, Variable):
+                terms.append(Term(item, 1.0))
+            elif isinstance(item, Term):
+                terms.append(item)
+            elif isinstance(item, Expression):
+                terms.extend(item._terms)
+                constant += item._constant
+            else:
+                raise TypeError(f"unsupported operand type(s) for +: {type(item)}")
+
+        return Expression(tuple(terms), constant)
+
     def variables(self) -> list[Variable]:
         variables = []
         for t in self._terms:
@@ -463,6 +495,10 @@ class Solver:
     def __init__(self):
         self._solver = kiwi.Solver()
         self._constraints: set[Constraint] = set()
+        # Objects update the solver every time one of their variables is read, which
+        # happens many times per frame, so the variables are only updated again after
+        # the constraints have changed
+        self._stale = False
 
     def _find(self, v: str | Variable) -> tuple[Variable | None, set[Constraint]]:
         if isinstance(v, Variable):
@@ -488,21 +524,26 @@ class Solver:
     def reset(self) -> None:
         self._solver = kiwi.Solver()
         self._constraints.clear()
+        self._stale = True
 
     def add(self, c: Constraint) -> None:
         logger.verbose("Adding constraint %s", c)
         self._constraints.add(c)
+        self._stale = True
         self._solver.addConstraint(c._constraint)
 
     def remove(self, c: Constraint) -> None:
         self._constraints.remove(c)
+        self._stale = True
         self._solver.removeConstraint(c._constraint)
 
     def hasConstraint(self, c: Constraint) -> bool:
         return self._solver.hasConstraint(c._constraint)
 
     def update(self) -> None:
-        self._solver.updateVariables()
+        if self._stale:
+            self._solver.updateVariables()
+            self._stale = False
 
     def dumps(self) -> str:
         self.update()
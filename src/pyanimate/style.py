@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from enum import Enum
 from typing import Any
 
@@ -57,14 +58,17 @@ class Style:
         self._parent_obj_style: Style | None = parent_obj_style
 
     def _attr(self, attr_name: str) -> Any:
-        attr = getattr(self, attr_name)
-        if attr is not None:
-            return attr
-
-        assert self._parent is not None
-
-        # This seems like a pylint bug, protected access should be fine here
-        return self._parent._attr(attr_name)  # pylint: disable=protected-access
+        # Every style property is looked up through this, once per draw call, so the
+        # parents are walked with a loop instead of a recursive call per parent
+        style = self
+        while True:
+            attr = getattr(style, attr_name)
+            if attr is not None:
+                return attr
+
+            # This seems like a pylint bug, protected access should be fine here
+            style = style._parent  # pylint: disable=protected-access
+            assert style is not None
 
     def _composite_color(self, attr: str) -> Color:
         color: Color = self._attr(attr)
@@ -144,6 +148,20 @@ class Style:
         # automatically work if the parent is set?
         return Style(parent=self, parent_obj_style=self._parent_obj_style, **kwargs)
 
+    def __deepcopy__(self, memo) -> Style:
+        cls = self.__class__
+        copy = cls.__new__(cls)
+        memo[id(self)] = copy
+
+        # All of the style values are immutable, so they can be shared with the copy
+        # and only the parent styles need to be copied. This avoids going through the
+        # generic `deepcopy` for every value when a canvas is cloned.
+        copy.__dict__.update(self.__dict__)
+        copy._parent = deepcopy(self._parent, memo)
+        copy._parent_obj_style = deepcopy(self._parent_obj_style, memo)
+
+        return copy
+
     def __str__(self) -> str:
         return str(self.__dict__)
 
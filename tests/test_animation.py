@@ -0,0 +1,173 @@
+import pytest
+
+from pyanimate.animation import (
+    Animation,
+    AnimationGroup,
+    FadeIn,
+    RgbTransform,
+    StaticAnimation,
+    Translate,
+)
+from pyanimate.easing import ease_in_quad
+from pyanimate.layout import Object, Proxy
+from pyanimate.shape import BLUE, RED, Color
+from pyanimate.shape import Point as P
+
+
+def overshoot(t: float) -> float:
+    return t + 3 * t * (1 - t)
+
+
+def undershoot(t: float) -> float:
+    return t - 3 * t * (1 - t)
+
+
+class RecordingAnimation(Animation):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.progress: list[float] = []
+
+    def step(self, progress: float) -> None:
+        self.progress.append(progress)
+
+
+class TestAnimation:
+    def test_zero_duration_rejected(self) -> None:
+        with pytest.raises(AssertionError):
+            RecordingAnimation(duration=0)
+
+
+class TestAnimationGroup:
+    def test_progress_scaled_to_child_duration(self) -> None:
+        short = RecordingAnimation(duration=1)
+        long = RecordingAnimation(duration=2)
+        group = AnimationGroup([short, long])
+
+        group.play(lambda: None, frame_rate=2)
+
+        assert long.progress == [0.0, 0.25, 0.5, 0.75]
+        # The shorter animation stays at its end state once it has finished
+        assert short.progress == [0.0, 0.5, 1.0, 1.0]
+
+
+class TestRgbTransform:
+    def test_interpolation(self, c) -> None:
+        obj = Object(c, fill_color=RED)
+        anim = RgbTransform(obj, RED, BLUE)
+
+        anim.step(0.0)
+        assert obj.style.fill_color == RED
+
+        # The midpoint is computed in linear light, so it is brighter than the
+        # midpoint of the sRGB values
+        anim.step(0.5)
+        assert obj.style.fill_color == Color(188, 0, 188)
+
+        anim.step(1.0)
+        assert obj.style.fill_color == BLUE
+
+
+class TestEasing:
+    def test_easing_applied_to_progress(self, c) -> None:
+        obj = Object(c)
+        anim = FadeIn(obj, easing=ease_in_quad)
+
+        anim.step(0.5)
+        assert obj.style.alpha == 63
+
+        anim.step(1.0)
+        assert obj.style.alpha == 255
+
+    def test_overshoot_clamped_for_colors(self, c) -> None:
+        obj = Object(c, fill_color=RED)
+
+        # Without clamping, the negative and too large channel values would borrow from
+        # and carry into the neighboring channels
+        anim = RgbTransform(obj, RED, BLUE, easing=undershoot)
+        anim.step(0.5)
+        assert obj.style.fill_color == RED
+
+        anim = RgbTransform(obj, RED, BLUE, easing=overshoot)
+        anim.step(0.5)
+        assert obj.style.fill_color == BLUE
+
+    def test_overshoot_clamped_for_alpha(self, c) -> None:
+        obj = Object(c)
+
+        anim = FadeIn(obj, easing=undershoot)
+        anim.step(0.5)
+        assert obj.style.alpha == 0
+
+        anim = FadeIn(obj, easing=overshoot)
+        anim.step(0.5)
+        assert obj.style.alpha == 255
+
+
+class TestDirty:
+    def test_static_animation_not_dirty(self, c) -> None:
+        anim = StaticAnimation(Proxy(Object(c)))
+
+        anim.step(0.0)
+        assert not anim.dirty
+
+    def test_unchanged_style_not_dirty(self, c) -> None:
+        obj = Object(c)
+        anim = RgbTransform(obj, RED, RED)
+
+        anim.step(0.0)
+        assert anim.dirty
+
+        anim.step(0.5)
+        assert not anim.dirty
+
+    def test_unchanged_alpha_not_dirty(self, c) -> None:
+        obj = Object(c)
+        anim = FadeIn(obj)
+
+        anim.step(0.0)
+        assert anim.dirty
+
+        # 255 * 0.001 still truncates to an alpha of 0
+        anim.step(0.001)
+        assert not anim.dirty
+        assert obj.style.alpha == 0
+
+    def test_group_dirty_if_any_child_dirty(self, c) -> None:
+        static = StaticAnimation(Proxy(Object(c)))
+        fade = FadeIn(Object(c))
+        group = AnimationGroup([static, fade])
+
+        group.step(0.0)
+        assert group.dirty
+
+        group.step(0.5)
+        assert group.dirty
+
+    def test_static_group_not_dirty(self, c) -> None:
+        group = AnimationGroup([StaticAnimation(Proxy(Object(c)))])
+
+        group.step(0.0)
+        assert not group.dirty
+
+    def test_finished_transform_not_dirty(self, c) -> None:
+        anim = FadeIn(Object(c))
+
+        anim.step(1.0)
+        assert anim.dirty
+
+        anim.step(1.0)
+        assert not anim.dirty
+
+    def test_replayed_transform_dirty(self, c) -> None:
+        obj = Object(c)
+        c.add(obj)
+        fade = FadeIn(obj)
+        translate = Translate(obj, P(0, 2), relative=True)
+
+        for anim in (fade, translate):
+            anim.step(1.0)
+            anim.step(1.0)
+            assert not anim.dirty
+
+            anim.step(0.0)
+            assert anim.dirty
@@ -0,0 +1,43 @@
+import pytest
+
+from pyanimate import easing
+
+EASINGS = [
+    easing.linear,
+    easing.ease_in_quad,
+    easing.ease_out_quad,
+    easing.ease_in_out_quad,
+    easing.ease_in_cubic,
+    easing.ease_out_cubic,
+    easing.ease_in_out_cubic,
+]
+
+
+@pytest.mark.parametrize("f", EASINGS)
+def test_endpoints(f) -> None:
+    assert f(0.0) == 0.0
+    assert f(1.0) == 1.0
+
+
+@pytest.mark.parametrize("f", EASINGS)
+def test_monotonic(f) -> None:
+    values = [f(i / 100) for i in range(101)]
+    assert values == sorted(values)
+
+
+def test_ease_in_out_symmetric() -> None:
+    assert easing.ease_in_out_quad(0.5) == 0.5
+    assert easing.ease_in_out_cubic(0.5) == 0.5
+    assert easing.ease_in_out_cubic(0.25) == pytest.approx(
+        1 - easing.ease_in_out_cubic(0.75)
+    )
+
+
+@pytest.mark.parametrize("f", EASINGS)
+def test_tabulate(f) -> None:
+    tabulated = easing.tabulate(f)
+
+    assert tabulated(0.0) == 0.0
+    assert tabulated(1.0) == 1.0
+    for i in range(101):
+        assert tabulated(i / 100) == pytest.approx(f(i / 100), abs=0.01)
@@ -91,7 +91,7 @@ class TestParentFadeIn(FadeInTestBase):
         s.add(FadeIn(c, duration=2))
 
     def num_frames(self) -> int:
-        return 11
+        return 10
 
     def frame(self, num) -> list[str]:
         if num == 0:
@@ -103,22 +103,12 @@ class TestParentFadeIn(FadeInTestBase):
                 "wwwww",
             ]
 
-        if num < 10:
-            return [
-                "wwwww",
-                "w???.",
-                "w??..",
-                "w???.",
-                "w???.",
-            ]
-
-        assert num == 10
         return [
             "wwwww",
-            "wbbb.",
-            "wb?..",
-            "wb?..",
-            "wbbb.",
+            "w???.",
+            "w??..",
+            "w???.",
+            "w???.",
         ]
 
 
@@ -77,6 +77,20 @@ class TestParentChildObject:
         with pytest.raises(AssertionError):
             parent.add(child)
 
+    def test_extend(self, c) -> None:
+        """
+        Test that extend adds each object in order at the given offset
+        """
+        parent = Object(c)
+        children = [Object(c), Object(c)]
+
+        parent.extend(children, P(10, 20))
+
+        assert list(parent.children) == children
+        for child in children:
+            assert parent.children[child] == P(10, 20)
+            assert child.parent == parent
+
     def test_remove(self, parent, child, mock_renderer) -> None:
         assert child in parent.children
         assert parent.children[child] == P(0, 0)
@@ -4,6 +4,7 @@ from pyanimate.layout import Align, Spacer
 from pyanimate.renderer import PILRenderer, RenderContext
 from pyanimate.shape import RED, WHITE
 from pyanimate.shape import Point as P
+from pyanimate.style import Style
 
 from . import ImageTestBase
 
@@ -28,6 +29,29 @@ class TestRenderer:
         assert renderer.image.mode == "RGBA"
         assert renderer.image.size == (20, 40)
 
+    def test_text_bbox_cached(self) -> None:
+        ctx = RenderContext(width=10, height=20, dpi=(300, 300), scale=2)
+        renderer = PILRenderer(ctx)
+        style = Style(font_size=8)
+
+        bbox = renderer.text_bbox("A", style)
+        assert renderer.text_bbox("A", style) is bbox
+        assert renderer.text_bbox("A", style.clone(font_size=16)) != bbox
+
+    def test_lines(self) -> None:
+        ctx = RenderContext(width=10, height=20, dpi=(300, 300), scale=2)
+        style = Style(stroke_color=RED)
+        segments = [(P(0, 0), P(5, 0)), (P(0, 5), P(5, 10))]
+
+        expected = PILRenderer(ctx)
+        for p1, p2 in segments:
+            expected.line(p1, p2, style)
+
+        renderer = PILRenderer(ctx)
+        renderer.lines(segments, style)
+
+        assert renderer.image.tobytes() == expected.image.tobytes()
+
 
 class TestTextBoxAlignLeft(ImageTestBase):
     @pytest.fixture(scope="class")
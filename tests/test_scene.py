@@ -1,9 +1,11 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from pyanimate.animation import StaticAnimation, Translate
+from pyanimate.scene import MAX_PENDING_WRITES
 from pyanimate.shape import RED
 from pyanimate.shape import Point as P
 
@@ -19,6 +21,28 @@ class TestEmptyScene:
         assert not p.exists()
 
 
+class TestPendingWrites:
+    def test_pending_writes_bounded(self, s) -> None:
+        """
+        Test that only a bounded number of frames wait to be written, and that they are
+        written in order
+        """
+        written = []
+        s._writer = ThreadPoolExecutor(max_workers=1)
+        try:
+            for i in range(10):
+                s._write(written.append, i)
+                assert len(s._pending_writes) <= MAX_PENDING_WRITES
+
+            s._wait_for_writes()
+        finally:
+            s._writer.shutdown()
+            s._writer = None
+
+        assert written == list(range(10))
+        assert not s._pending_writes
+
+
 class TestStaticAnimation5x5(AnimationTestBase):
     @pytest.fixture(scope="class", autouse=True)
     def setup_scene(self, s) -> None:
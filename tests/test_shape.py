@@ -48,7 +48,8 @@ class TestIntShape:
         s1 = Shape(2, 2)
         s2 = copy.deepcopy(s1)
         assert s1 == s2
-        assert s1 is not s2
+        # Shapes of numbers are immutable, so they don't need to be copied
+        assert s1 is s2
 
     def test_get(self) -> None:
         s1 = Shape(2, 3)
@@ -202,6 +203,14 @@ class TestUnresolvedShape:
         assert s2[1] == 0
         assert s2[2] == 1
 
+    def test_deepcopy(self, x: Variable) -> None:
+        s1 = Shape(x, 2)
+        s2 = copy.deepcopy(s1)
+        assert s2 is not s1
+        assert s2[0] is not x
+        assert s2[0].name() == x.name()
+        assert s2[1] == 2
+
     def test_get_mixed_int(self, x) -> None:
         s1 = Shape(x, 2)
         s2 = s1.get()
@@ -1,6 +1,6 @@
 import copy
 
-from pyanimate.solver import Solver, Variable
+from pyanimate.solver import Expression, Solver, Variable
 
 
 class TestSolver:
@@ -16,6 +16,29 @@ class TestSolver:
         for c in s1._constraints:
             assert c not in s2._constraints
 
+    def test_update_after_change(self) -> None:
+        s = Solver()
+        x = Variable("x")
+        y = Variable("y")
+
+        s.add(x == 5)
+        s.update()
+        assert x.value() == 5
+
+        # Nothing changed, so this doesn't need to solve again
+        s.update()
+        assert x.value() == 5
+
+        c = y == x + 1
+        s.add(c)
+        s.update()
+        assert y.value() == 6
+
+        s.remove(c)
+        s.add(y == x + 2)
+        s.update()
+        assert y.value() == 7
+
     # def test_clone_canvas(self) -> None:
     #     c1 = Canvas()
     #     for c in [c1._w, c1._h, c1._x, c1._y]:
@@ -32,3 +55,18 @@ class TestSolver:
     #     assert len(c1.solver._constraints) == len(c2.solver._constraints) == 4
     #     for c in c1.solver._constraints:
     #         assert c not in c2.solver._constraints
+
+
+class TestExpression:
+    def test_from_sum(self) -> None:
+        s = Solver()
+        x = Variable("x")
+        y = Variable("y")
+        z = Variable("z")
+
+        s.add(x == 1)
+        s.add(y == 2)
+        s.add(z == Expression.from_sum([x, y * 3, x + 4, 5]))
+        s.update()
+
+        assert z.value() == 1 + 6 + 5 + 5
@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import pytest
 
 from pyanimate.shape import BLACK, BLUE, RED, WHITE, Color
@@ -58,6 +60,20 @@ class TestStyle:
         assert child_style.fill_color == RED
         assert child_style.font_color == BLACK
 
+    def test_deepcopy(self, style) -> None:
+        child_style = Style(parent=style, padding=10, parent_obj_style=style)
+
+        copied = deepcopy(child_style)
+
+        assert copied is not child_style
+        assert copied.padding == 10
+        assert copied.fill_color == RED
+
+        # A style that is both the parent and the parent object style is only copied
+        # once
+        assert copied._parent is not style
+        assert copied._parent is copied.parent_obj_style
+
     def test_composite_transparent(self, c, style) -> None:
         assert c.style.alpha == 255
 